@@ -5,13 +5,50 @@ LingoDotDevEngine implementation for Python SDK - Async version with httpx
 # mypy: disable-error-code=unreachable
 
 import asyncio
-from typing import Any, Callable, Dict, List, Optional
+import contextlib
+import json
+import secrets
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
 from urllib.parse import urljoin
 
 import httpx
-from nanoid import generate
 from pydantic import BaseModel, Field, validator
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
+_DEFAULT_TIMEOUT = httpx.Timeout(60.0)
+
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+
+def _json_dumps(payload: Any) -> bytes:
+    """Serialize a request body to UTF-8 JSON, using orjson when installed"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            # orjson rejects integers wider than 64 bits and deep nesting
+            # that the stdlib encoder still handles
+            pass
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _json_loads(content: bytes) -> Any:
+    """Parse a JSON response body, using orjson when installed"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _copy_model(model: _ModelT, **update: Any) -> _ModelT:
+    """Copy a pydantic model with updated fields, skipping validation"""
+    if hasattr(model, "model_copy"):
+        return model.model_copy(update=update)
+    return model.copy(update=update)
+
 
 class EngineConfig(BaseModel):
     """Configuration for the LingoDotDevEngine"""
@@ -20,6 +57,9 @@ class EngineConfig(BaseModel):
     api_url: str = "https://engine.lingo.dev"
     batch_size: int = Field(default=25, ge=1, le=250)
     ideal_batch_item_size: int = Field(default=250, ge=1, le=2500)
+    keepalive_expiry: float = Field(default=60.0, gt=0)
+    max_concurrency: int = Field(default=16, ge=1)
+    prewarm: bool = False
 
     @validator("api_url")
     @classmethod
@@ -54,10 +94,21 @@ class LingoDotDevEngine:
         """
         self.config = EngineConfig(**config)
         self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._prewarm_task: Optional[asyncio.Future] = None
+        self._base_headers = {
+            "Content-Type": "application/json; charset=utf-8",
+            "Authorization": f"Bearer {self.config.api_key}",
+        }
+        self._i18n_url = urljoin(self.config.api_url, "/i18n")
+        self._recognize_url = urljoin(self.config.api_url, "/recognize")
+        self._whoami_url = urljoin(self.config.api_url, "/whoami")
 
     async def __aenter__(self):
         """Async context manager entry"""
         await self._ensure_client()
+        if self.config.prewarm:
+            self._prewarm_task = asyncio.ensure_future(self._prewarm_connection())
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -68,17 +119,38 @@ class LingoDotDevEngine:
         """Ensure the httpx client is initialized"""
         if self._client is None or self._client.is_closed:
             self._client = httpx.AsyncClient(
-                headers={
-                    "Content-Type": "application/json; charset=utf-8",
-                    "Authorization": f"Bearer {self.config.api_key}",
-                },
-                timeout=60.0,
+                headers=self._base_headers,
+                timeout=_DEFAULT_TIMEOUT,
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=50,
+                    keepalive_expiry=self.config.keepalive_expiry,
+                ),
+                http2=True,
             )
+            self._semaphore = asyncio.Semaphore(self.config.max_concurrency)
+
+    async def _prewarm_connection(self):
+        """Open a connection to the API ahead of the first real request"""
+        assert self._client is not None  # Type guard for mypy
+        try:
+            await self._client.head(self.config.api_url, timeout=5.0)
+        except httpx.HTTPError:
+            # Warming is best-effort; real requests report their own errors
+            pass
 
     async def close(self):
         """Close the httpx client"""
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
+        try:
+            if self._prewarm_task is not None:
+                # Let a pending warm-up request unwind before closing its client
+                self._prewarm_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await self._prewarm_task
+        finally:
+            self._prewarm_task = None
+            if self._client and not self._client.is_closed:
+                await self._client.aclose()
 
     async def _localize_raw(
         self,
@@ -102,35 +174,49 @@ class LingoDotDevEngine:
             Localized content
         """
         await self._ensure_client()
-        chunked_payload = self._extract_payload_chunks(payload)
-        workflow_id = generate()
+        workflow_id = secrets.token_urlsafe(16)
+        result: Dict[str, str] = {}
+
+        # Fields shared by every chunk request of this workflow
+        request_context: Dict[str, Any] = {
+            "params": {"workflowId": workflow_id, "fast": params.fast or False},
+            "locale": {"source": params.source_locale, "target": params.target_locale},
+        }
+        if params.reference:
+            request_context["reference"] = params.reference
 
         if concurrent and not progress_callback:
-            # Process chunks concurrently for better performance
+            # Process chunks concurrently for better performance, dispatching
+            # each request while the next chunk is still being extracted
             tasks = []
-            for chunk in chunked_payload:
-                task = self._localize_chunk(
-                    params.source_locale,
-                    params.target_locale,
-                    {"data": chunk, "reference": params.reference},
-                    workflow_id,
-                    params.fast or False,
-                )
-                tasks.append(task)
+            try:
+                for chunk in self._iter_payload_chunks(payload):
+                    task = asyncio.ensure_future(
+                        self._localize_chunk(chunk, request_context)
+                    )
+                    tasks.append(task)
+                    await asyncio.sleep(0)
+
+                # gather keeps chunk order, preserving the payload's key order
+                processed_payload_chunks = await asyncio.gather(*tasks)
+            except BaseException:
+                # Don't leave dispatched requests running after a failure
+                # or cancellation
+                for task in tasks:
+                    task.cancel()
+                raise
 
-            processed_payload_chunks = await asyncio.gather(*tasks)
+            for processed_payload_chunk in processed_payload_chunks:
+                result.update(processed_payload_chunk)
         else:
             # Process chunks sequentially (supports progress tracking)
-            processed_payload_chunks = []
+            chunked_payload = self._extract_payload_chunks(payload)
+            total_chunks = len(chunked_payload)
             for i, chunk in enumerate(chunked_payload):
-                percentage_completed = round(((i + 1) / len(chunked_payload)) * 100)
+                percentage_completed = round(((i + 1) / total_chunks) * 100)
 
                 processed_payload_chunk = await self._localize_chunk(
-                    params.source_locale,
-                    params.target_locale,
-                    {"data": chunk, "reference": params.reference},
-                    workflow_id,
-                    params.fast or False,
+                    chunk, request_context
                 )
 
                 if progress_callback:
@@ -138,50 +224,39 @@ class LingoDotDevEngine:
                         percentage_completed, chunk, processed_payload_chunk
                     )
 
-                processed_payload_chunks.append(processed_payload_chunk)
-
-        result = {}
-        for chunk in processed_payload_chunks:
-            result.update(chunk)
+                result.update(processed_payload_chunk)
 
         return result
 
     async def _localize_chunk(
         self,
-        source_locale: Optional[str],
-        target_locale: str,
-        payload: Dict[str, Any],
-        workflow_id: str,
-        fast: bool,
+        chunk: Dict[str, Any],
+        request_context: Dict[str, Any],
     ) -> Dict[str, str]:
         """
         Localize a single chunk of content
 
+        The httpx client must already be initialized via _ensure_client.
+
         Args:
-            source_locale: Source locale
-            target_locale: Target locale
-            payload: Payload containing the chunk to be localized
-            workflow_id: Workflow ID for tracking
-            fast: Whether to use fast mode
+            chunk: The chunk of content to be localized
+            request_context: Request fields shared by every chunk of the workflow
+                (params, locale and optional reference)
 
         Returns:
             Localized chunk
         """
-        await self._ensure_client()
         assert self._client is not None  # Type guard for mypy
-        url = urljoin(self.config.api_url, "/i18n")
+        assert self._semaphore is not None  # Type guard for mypy
+        url = self._i18n_url
 
-        request_data = {
-            "params": {"workflowId": workflow_id, "fast": fast},
-            "locale": {"source": source_locale, "target": target_locale},
-            "data": payload["data"],
-        }
-
-        if payload.get("reference"):
-            request_data["reference"] = payload["reference"]
+        request_data = {**request_context, "data": chunk}
 
         try:
-            response = await self._client.post(url, json=request_data)
+            async with self._semaphore:
+                response = await self._client.post(
+                    url, content=_json_dumps(request_data)
+                )
 
             if not response.is_success:
                 if 500 <= response.status_code < 600:
@@ -196,7 +271,7 @@ class LingoDotDevEngine:
                 else:
                     raise RuntimeError(response.text)
 
-            json_response = response.json()
+            json_response = _json_loads(response.content)
 
             # Handle streaming errors
             if not json_response.get("data") and json_response.get("error"):
@@ -217,27 +292,38 @@ class LingoDotDevEngine:
         Returns:
             An array of payload chunks
         """
-        result = []
-        current_chunk = {}
+        return list(self._iter_payload_chunks(payload))
+
+    def _iter_payload_chunks(self, payload: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield payload chunks based on the ideal chunk size
+
+        Args:
+            payload: The payload to be chunked
+
+        Yields:
+            Payload chunks, in payload key order
+        """
+        current_chunk: Dict[str, Any] = {}
         current_chunk_item_count = 0
+        current_chunk_size = 0
+        last_index = len(payload) - 1
 
-        for key, value in payload.items():
+        for index, (key, value) in enumerate(payload.items()):
             current_chunk[key] = value
             current_chunk_item_count += 1
-
-            current_chunk_size = self._count_words_in_record(current_chunk)
+            current_chunk_size += self._count_words_in_record(value)
 
             if (
                 current_chunk_size > self.config.ideal_batch_item_size
                 or current_chunk_item_count >= self.config.batch_size
-                or key == list(payload.keys())[-1]
+                or index == last_index
             ):
 
-                result.append(current_chunk)
+                yield current_chunk
                 current_chunk = {}
                 current_chunk_item_count = 0
-
-        return result
+                current_chunk_size = 0
 
     def _count_words_in_record(self, payload: Any) -> int:
         """
@@ -249,14 +335,65 @@ class LingoDotDevEngine:
         Returns:
             The total number of words
         """
-        if isinstance(payload, list):
-            return sum(self._count_words_in_record(item) for item in payload)
-        elif isinstance(payload, dict):
-            return sum(self._count_words_in_record(item) for item in payload.values())
-        elif isinstance(payload, str):
-            return len([word for word in payload.strip().split() if word])
-        else:
-            return 0
+        total = 0
+        stack = [payload]
+
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                total += len(item.split())
+            elif isinstance(item, dict):
+                stack.extend(item.values())
+            elif isinstance(item, list):
+                stack.extend(item)
+
+        return total
+
+    @staticmethod
+    def _wrap_progress_callback(
+        progress_callback: Optional[Callable[[int], None]],
+    ) -> Optional[Callable[[int, Dict[str, str], Dict[str, str]], None]]:
+        """
+        Adapt a percentage-only progress callback to the per-chunk signature
+
+        Args:
+            progress_callback: Optional callback function to report progress (0-100)
+
+        Returns:
+            A chunk progress callback, or None if no callback was given
+        """
+        if not progress_callback:
+            return None
+
+        def wrapped_progress_callback(
+            progress: int, source_chunk: Dict[str, str], processed_chunk: Dict[str, str]
+        ):
+            progress_callback(progress)
+
+        return wrapped_progress_callback
+
+    async def _localize_text(
+        self,
+        text: str,
+        params: LocalizationParams,
+        progress_callback: Optional[Callable[[int], None]] = None,
+    ) -> str:
+        """
+        Localize a single text string with already validated parameters
+
+        Args:
+            text: The text string to be localized
+            params: Localization parameters
+            progress_callback: Optional callback function to report progress (0-100)
+
+        Returns:
+            The localized text string
+        """
+        response = await self._localize_raw(
+            {"text": text}, params, self._wrap_progress_callback(progress_callback)
+        )
+
+        return response.get("text", "")
 
     async def localize_object(
         self,
@@ -308,18 +445,7 @@ class LingoDotDevEngine:
             The localized text string
         """
         localization_params = LocalizationParams(**params)
-
-        def wrapped_progress_callback(
-            progress: int, source_chunk: Dict[str, str], processed_chunk: Dict[str, str]
-        ):
-            if progress_callback:
-                progress_callback(progress)
-
-        response = await self._localize_raw(
-            {"text": text}, localization_params, wrapped_progress_callback
-        )
-
-        return response.get("text", "")
+        return await self._localize_text(text, localization_params, progress_callback)
 
     async def batch_localize_text(self, text: str, params: Dict[str, Any]) -> List[str]:
         """
@@ -338,22 +464,37 @@ class LingoDotDevEngine:
         if "target_locales" not in params:
             raise ValueError("target_locales is required")
 
-        target_locales = params["target_locales"]
+        target_locales = list(params["target_locales"])
+        if not target_locales:
+            return []
+
         source_locale = params.get("source_locale")
         fast = params.get("fast", False)
 
-        # Create tasks for concurrent execution
-        tasks = []
+        # Validate the shared parameters once; further string locales are copied
+        # in without re-validation, anything else still goes through the model
+        base_params = LocalizationParams(
+            source_locale=source_locale, target_locale=target_locales[0], fast=fast
+        )
+        locale_params = []
         for target_locale in target_locales:
-            task = self.localize_text(
-                text,
-                {
-                    "source_locale": source_locale,
-                    "target_locale": target_locale,
-                    "fast": fast,
-                },
-            )
-            tasks.append(task)
+            if isinstance(target_locale, str):
+                locale_params.append(
+                    _copy_model(base_params, target_locale=target_locale)
+                )
+            else:
+                locale_params.append(
+                    LocalizationParams(
+                        source_locale=source_locale,
+                        target_locale=target_locale,
+                        fast=fast,
+                    )
+                )
+
+        # Create tasks for concurrent execution
+        tasks = [
+            self._localize_text(text, locale_param) for locale_param in locale_params
+        ]
 
         # Execute all localization tasks concurrently
         responses = await asyncio.gather(*tasks)
@@ -380,22 +521,15 @@ class LingoDotDevEngine:
             Array of localized chat messages with preserved structure
         """
         # Validate chat format
-        for message in chat:
-            if "name" not in message or "text" not in message:
-                raise ValueError(
-                    "Each chat message must have 'name' and 'text' properties"
-                )
+        if not all("name" in message and "text" in message for message in chat):
+            raise ValueError("Each chat message must have 'name' and 'text' properties")
 
         localization_params = LocalizationParams(**params)
 
-        def wrapped_progress_callback(
-            progress: int, source_chunk: Dict[str, str], processed_chunk: Dict[str, str]
-        ):
-            if progress_callback:
-                progress_callback(progress)
-
         localized = await self._localize_raw(
-            {"chat": chat}, localization_params, wrapped_progress_callback
+            {"chat": chat},
+            localization_params,
+            self._wrap_progress_callback(progress_callback),
         )
 
         # The API returns the localized chat in the same structure
@@ -420,10 +554,10 @@ class LingoDotDevEngine:
 
         await self._ensure_client()
         assert self._client is not None  # Type guard for mypy
-        url = urljoin(self.config.api_url, "/recognize")
+        url = self._recognize_url
 
         try:
-            response = await self._client.post(url, json={"text": text})
+            response = await self._client.post(url, content=_json_dumps({"text": text}))
 
             if not response.is_success:
                 if 500 <= response.status_code < 600:
@@ -435,7 +569,7 @@ class LingoDotDevEngine:
                     f"Error recognizing locale: {response.reason_phrase}"
                 )
 
-            json_response = response.json()
+            json_response = _json_loads(response.content)
             return json_response.get("locale") or ""
 
         except httpx.RequestError as e:
@@ -450,13 +584,13 @@ class LingoDotDevEngine:
         """
         await self._ensure_client()
         assert self._client is not None  # Type guard for mypy
-        url = urljoin(self.config.api_url, "/whoami")
+        url = self._whoami_url
 
         try:
             response = await self._client.post(url)
 
             if response.is_success:
-                payload = response.json()
+                payload = _json_loads(response.content)
                 if payload.get("email"):
                     return {"email": payload["email"], "id": payload["id"]}
 
@@ -0,0 +1,16 @@
+"""
+Shared test doubles
+"""
+
+import json
+
+
+class FakeResponse:
+    """Minimal stand-in for the parts of httpx.Response the engine reads"""
+
+    def __init__(self, status_code=200, payload=None, reason_phrase="", text=""):
+        self.is_success = 200 <= status_code < 300
+        self.status_code = status_code
+        self.reason_phrase = reason_phrase
+        self.text = text
+        self.content = json.dumps({} if payload is None else payload).encode()
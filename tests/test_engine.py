@@ -2,12 +2,30 @@
 Tests for the LingoDotDevEngine class
 """
 
+import json
 import pytest
 import asyncio
-from unittest.mock import Mock, patch, AsyncMock
+import httpx
+from unittest.mock import patch, AsyncMock
 
 from lingodotdev import LingoDotDevEngine
-from lingodotdev.engine import EngineConfig
+from lingodotdev.engine import EngineConfig, _json_dumps, _json_loads
+
+from .helpers import FakeResponse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSON_BACKENDS = [
+    pytest.param(None, id="stdlib"),
+    pytest.param(
+        orjson,
+        id="orjson",
+        marks=pytest.mark.skipif(orjson is None, reason="orjson is not installed"),
+    ),
+]
 
 
 class TestEngineConfig:
@@ -32,6 +50,9 @@ class TestEngineConfig:
         assert config.api_url == "https://engine.lingo.dev"
         assert config.batch_size == 25
         assert config.ideal_batch_item_size == 250
+        assert config.keepalive_expiry == 60.0
+        assert config.max_concurrency == 16
+        assert config.prewarm is False
 
     def test_invalid_api_url(self):
         """Test invalid API URL validation"""
@@ -54,8 +75,48 @@ class TestEngineConfig:
         with pytest.raises(ValueError):
             EngineConfig(api_key="test_key", ideal_batch_item_size=3000)
 
+    def test_invalid_max_concurrency(self):
+        """Test invalid max concurrency validation"""
+        with pytest.raises(ValueError):
+            EngineConfig(api_key="test_key", max_concurrency=0)
+
+    def test_invalid_keepalive_expiry(self):
+        """Test invalid keepalive expiry validation"""
+        with pytest.raises(ValueError):
+            EngineConfig(api_key="test_key", keepalive_expiry=0)
+
+
+@pytest.mark.parametrize("backend", JSON_BACKENDS)
+class TestJsonHelpers:
+    """Test the JSON helpers behave the same with and without orjson"""
+
+    @staticmethod
+    def stdlib_dumps(payload):
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+
+    def test_json_dumps(self, backend):
+        """Test request bodies are compact UTF-8 with stringified keys"""
+        payload = {"text": "héllo wörld 你好", 1: "one", "nested": {"k": [1, 2.5]}}
+        with patch("lingodotdev.engine.orjson", backend):
+            assert _json_dumps(payload) == self.stdlib_dumps(payload)
+
+    def test_json_dumps_falls_back_to_stdlib(self, backend):
+        """Test payloads orjson rejects are still serialized"""
+        deep: object = "hello"
+        for _ in range(300):
+            deep = {"nested": [deep]}
+
+        with patch("lingodotdev.engine.orjson", backend):
+            assert _json_dumps({"big": 2**70}) == b'{"big":1180591620717411303424}'
+            assert _json_dumps(deep) == self.stdlib_dumps(deep)
+
+    def test_json_loads(self, backend):
+        """Test response bodies are parsed from bytes"""
+        content = '{"data":{"greeting":"¡hola!"}}'.encode()
+        with patch("lingodotdev.engine.orjson", backend):
+            assert _json_loads(content) == {"data": {"greeting": "¡hola!"}}
+
 
-@pytest.mark.asyncio
 class TestLingoDotDevEngine:
     """Test the LingoDotDevEngine class"""
 
@@ -68,6 +129,10 @@ class TestLingoDotDevEngine:
             "ideal_batch_item_size": 100,
         }
         self.engine = LingoDotDevEngine(self.config)
+        self.request_context = {
+            "params": {"workflowId": "workflow_id", "fast": False},
+            "locale": {"source": "en", "target": "es"},
+        }
 
     def test_initialization(self):
         """Test engine initialization"""
@@ -83,6 +148,56 @@ class TestLingoDotDevEngine:
             assert engine._client is not None
             assert not engine._client.is_closed
 
+    @patch("lingodotdev.engine.httpx.AsyncClient.head")
+    async def test_async_context_manager_prewarm(self, mock_head):
+        """Test connection prewarming on context manager entry"""
+        async with LingoDotDevEngine({**self.config, "prewarm": True}) as engine:
+            await engine._prewarm_task
+        mock_head.assert_called_once_with("https://api.test.com", timeout=5.0)
+
+        mock_head.reset_mock()
+        async with LingoDotDevEngine(self.config) as engine:
+            assert engine._prewarm_task is None
+        mock_head.assert_not_called()
+
+    @patch("lingodotdev.engine.httpx.AsyncClient.head")
+    async def test_prewarm_errors_suppressed(self, mock_head):
+        """Test prewarm failures do not surface"""
+        mock_head.side_effect = httpx.ConnectError("unreachable")
+        async with LingoDotDevEngine({**self.config, "prewarm": True}) as engine:
+            await engine._prewarm_task
+
+    async def test_close_cancels_pending_prewarm(self):
+        """Test closing waits for a still pending prewarm request to be cancelled"""
+        head_cancelled = False
+
+        async def blocked_head(url, **kwargs):
+            nonlocal head_cancelled
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                head_cancelled = True
+                raise
+
+        with patch(
+            "lingodotdev.engine.httpx.AsyncClient.head", side_effect=blocked_head
+        ):
+            async with LingoDotDevEngine({**self.config, "prewarm": True}) as engine:
+                await asyncio.sleep(0)
+                prewarm_task = engine._prewarm_task
+                assert not prewarm_task.done()
+
+        assert head_cancelled
+        assert prewarm_task.cancelled()
+        assert engine._prewarm_task is None
+        assert engine._client.is_closed
+
+    def test_endpoint_urls(self):
+        """Test endpoint URLs are resolved at construction time"""
+        assert self.engine._i18n_url == "https://api.test.com/i18n"
+        assert self.engine._recognize_url == "https://api.test.com/recognize"
+        assert self.engine._whoami_url == "https://api.test.com/whoami"
+
     def test_count_words_in_record_string(self):
         """Test word counting in strings"""
         assert self.engine._count_words_in_record("hello world") == 2
@@ -107,6 +222,13 @@ class TestLingoDotDevEngine:
             self.engine._count_words_in_record({"key1": {"nested": "hello world"}}) == 2
         )
 
+    def test_count_words_in_record_deeply_nested(self):
+        """Test word counting does not recurse on deeply nested payloads"""
+        payload: object = "hello world"
+        for _ in range(5000):
+            payload = {"nested": [payload]}
+        assert self.engine._count_words_in_record(payload) == 2
+
     def test_count_words_in_record_other_types(self):
         """Test word counting with non-string types"""
         assert self.engine._count_words_in_record(123) == 0
@@ -127,62 +249,68 @@ class TestLingoDotDevEngine:
         chunks = self.engine._extract_payload_chunks(payload)
         assert len(chunks) == 2  # Should split into 2 chunks based on batch_size=10
 
+    def test_extract_payload_chunks_by_word_count(self):
+        """Test payload chunking splits once the word budget is exceeded"""
+        payload = {f"key{i}": " ".join(["word"] * 40) for i in range(5)}
+        chunks = self.engine._extract_payload_chunks(payload)
+        # ideal_batch_item_size=100: a chunk closes once it holds >100 words
+        assert [len(chunk) for chunk in chunks] == [3, 2]
+
+    def test_extract_payload_chunks_preserves_all_keys(self):
+        """Test payload chunking keeps every key in its original order"""
+        payload = {f"key{i}": "hello world" for i in range(25)}
+        chunks = self.engine._extract_payload_chunks(payload)
+        assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+        assert [key for chunk in chunks for key in chunk] == list(payload)
+
     @patch("lingodotdev.engine.httpx.AsyncClient.post")
     async def test_localize_chunk_success(self, mock_post):
         """Test successful chunk localization"""
-        mock_response = Mock()
-        mock_response.is_success = True
-        mock_response.json.return_value = {"data": {"key": "translated_value"}}
-        mock_post.return_value = mock_response
+        mock_post.return_value = FakeResponse(
+            payload={"data": {"key": "translated_value"}}
+        )
 
+        await self.engine._ensure_client()
         result = await self.engine._localize_chunk(
-            "en", "es", {"data": {"key": "value"}}, "workflow_id", False
+            {"key": "value"}, self.request_context
         )
 
         assert result == {"key": "translated_value"}
         mock_post.assert_called_once()
 
+    @pytest.mark.parametrize(
+        "response, error, message",
+        [
+            (
+                FakeResponse(
+                    500,
+                    reason_phrase="Internal Server Error",
+                    text="Server error details",
+                ),
+                RuntimeError,
+                "Server error",
+            ),
+            (
+                FakeResponse(400, reason_phrase="Bad Request"),
+                ValueError,
+                "Invalid request \\(400\\)",
+            ),
+            (
+                FakeResponse(payload={"error": "Streaming error occurred"}),
+                RuntimeError,
+                "Streaming error occurred",
+            ),
+        ],
+        ids=["server_error", "bad_request", "streaming_error"],
+    )
     @patch("lingodotdev.engine.httpx.AsyncClient.post")
-    async def test_localize_chunk_server_error(self, mock_post):
-        """Test server error handling in chunk localization"""
-        mock_response = Mock()
-        mock_response.is_success = False
-        mock_response.status_code = 500
-        mock_response.reason_phrase = "Internal Server Error"
-        mock_response.text = "Server error details"
-        mock_post.return_value = mock_response
-
-        with pytest.raises(RuntimeError, match="Server error"):
-            await self.engine._localize_chunk(
-                "en", "es", {"data": {"key": "value"}}, "workflow_id", False
-            )
-
-    @patch("lingodotdev.engine.httpx.AsyncClient.post")
-    async def test_localize_chunk_bad_request(self, mock_post):
-        """Test bad request handling in chunk localization"""
-        mock_response = Mock()
-        mock_response.is_success = False
-        mock_response.status_code = 400
-        mock_response.reason_phrase = "Bad Request"
-        mock_post.return_value = mock_response
-
-        with pytest.raises(ValueError, match="Invalid request \\(400\\)"):
-            await self.engine._localize_chunk(
-                "en", "es", {"data": {"key": "value"}}, "workflow_id", False
-            )
+    async def test_localize_chunk_errors(self, mock_post, response, error, message):
+        """Test error handling in chunk localization"""
+        mock_post.return_value = response
 
-    @patch("lingodotdev.engine.httpx.AsyncClient.post")
-    async def test_localize_chunk_streaming_error(self, mock_post):
-        """Test streaming error handling in chunk localization"""
-        mock_response = Mock()
-        mock_response.is_success = True
-        mock_response.json.return_value = {"error": "Streaming error occurred"}
-        mock_post.return_value = mock_response
-
-        with pytest.raises(RuntimeError, match="Streaming error occurred"):
-            await self.engine._localize_chunk(
-                "en", "es", {"data": {"key": "value"}}, "workflow_id", False
-            )
+        await self.engine._ensure_client()
+        with pytest.raises(error, match=message):
+            await self.engine._localize_chunk({"key": "value"}, self.request_context)
 
     @patch("lingodotdev.engine.LingoDotDevEngine._localize_raw")
     async def test_localize_text(self, mock_localize_raw):
@@ -196,6 +324,15 @@ class TestLingoDotDevEngine:
         assert result == "translated_text"
         mock_localize_raw.assert_called_once()
 
+    def test_wrap_progress_callback(self):
+        """Test progress callback adaptation"""
+        assert self.engine._wrap_progress_callback(None) is None
+
+        progress = []
+        wrapped = self.engine._wrap_progress_callback(progress.append)
+        wrapped(50, {"key": "value"}, {"key": "valor"})
+        assert progress == [50]
+
     @patch("lingodotdev.engine.LingoDotDevEngine._localize_raw")
     async def test_localize_object(self, mock_localize_raw):
         """Test object localization"""
@@ -209,10 +346,10 @@ class TestLingoDotDevEngine:
         assert result == {"greeting": "hola", "farewell": "adiós"}
         mock_localize_raw.assert_called_once()
 
-    @patch("lingodotdev.engine.LingoDotDevEngine.localize_text")
-    async def test_batch_localize_text(self, mock_localize_text):
+    @patch("lingodotdev.engine.LingoDotDevEngine._localize_raw")
+    async def test_batch_localize_text(self, mock_localize_raw):
         """Test batch text localization"""
-        mock_localize_text.side_effect = AsyncMock(side_effect=["hola", "bonjour"])
+        mock_localize_raw.side_effect = [{"text": "hola"}, {"text": "bonjour"}]
 
         result = await self.engine.batch_localize_text(
             "hello",
@@ -220,7 +357,44 @@ class TestLingoDotDevEngine:
         )
 
         assert result == ["hola", "bonjour"]
-        assert mock_localize_text.call_count == 2
+        assert mock_localize_raw.call_count == 2
+        sent_params = [call.args[1] for call in mock_localize_raw.call_args_list]
+        assert [p.target_locale for p in sent_params] == ["es", "fr"]
+        assert all(p.source_locale == "en" and p.fast for p in sent_params)
+
+    @pytest.mark.parametrize("bad_locale", [None, 123])
+    @patch("lingodotdev.engine.LingoDotDevEngine._localize_raw")
+    async def test_batch_localize_text_invalid_later_locale(
+        self, mock_localize_raw, bad_locale
+    ):
+        """Test every target locale is validated, not just the first"""
+        with pytest.raises(ValueError):
+            await self.engine.batch_localize_text(
+                "hello", {"source_locale": "en", "target_locales": ["es", bad_locale]}
+            )
+        mock_localize_raw.assert_not_called()
+
+    @patch("lingodotdev.engine.LingoDotDevEngine._localize_raw")
+    async def test_batch_localize_text_iterable_target_locales(self, mock_localize_raw):
+        """Test target locales may be any iterable"""
+        mock_localize_raw.return_value = {"text": "translated"}
+
+        result = await self.engine.batch_localize_text(
+            "hello", {"source_locale": "en", "target_locales": {"es", "fr"}}
+        )
+
+        assert result == ["translated", "translated"]
+        sent_locales = {
+            call.args[1].target_locale for call in mock_localize_raw.call_args_list
+        }
+        assert sent_locales == {"es", "fr"}
+
+    async def test_batch_localize_text_empty_target_locales(self):
+        """Test batch text localization with no target locales"""
+        result = await self.engine.batch_localize_text(
+            "hello", {"source_locale": "en", "target_locales": []}
+        )
+        assert result == []
 
     async def test_batch_localize_text_missing_target_locales(self):
         """Test batch text localization with missing target_locales"""
@@ -262,15 +436,13 @@ class TestLingoDotDevEngine:
     @patch("lingodotdev.engine.httpx.AsyncClient.post")
     async def test_recognize_locale_success(self, mock_post):
         """Test successful locale recognition"""
-        mock_response = Mock()
-        mock_response.is_success = True
-        mock_response.json.return_value = {"locale": "es"}
-        mock_post.return_value = mock_response
+        mock_post.return_value = FakeResponse(payload={"locale": "es"})
 
         result = await self.engine.recognize_locale("Hola mundo")
 
         assert result == "es"
         mock_post.assert_called_once()
+        assert json.loads(mock_post.call_args[1]["content"]) == {"text": "Hola mundo"}
 
     async def test_recognize_locale_empty_text(self):
         """Test locale recognition with empty text"""
@@ -280,11 +452,9 @@ class TestLingoDotDevEngine:
     @patch("lingodotdev.engine.httpx.AsyncClient.post")
     async def test_recognize_locale_server_error(self, mock_post):
         """Test locale recognition with server error"""
-        mock_response = Mock()
-        mock_response.is_success = False
-        mock_response.status_code = 500
-        mock_response.reason_phrase = "Internal Server Error"
-        mock_post.return_value = mock_response
+        mock_post.return_value = FakeResponse(
+            500, reason_phrase="Internal Server Error"
+        )
 
         with pytest.raises(RuntimeError, match="Server error"):
             await self.engine.recognize_locale("Hello world")
@@ -292,13 +462,9 @@ class TestLingoDotDevEngine:
     @patch("lingodotdev.engine.httpx.AsyncClient.post")
     async def test_whoami_success(self, mock_post):
         """Test successful whoami request"""
-        mock_response = Mock()
-        mock_response.is_success = True
-        mock_response.json.return_value = {
-            "email": "test@example.com",
-            "id": "user_123",
-        }
-        mock_post.return_value = mock_response
+        mock_post.return_value = FakeResponse(
+            payload={"email": "test@example.com", "id": "user_123"}
+        )
 
         result = await self.engine.whoami()
 
@@ -308,10 +474,7 @@ class TestLingoDotDevEngine:
     @patch("lingodotdev.engine.httpx.AsyncClient.post")
     async def test_whoami_unauthenticated(self, mock_post):
         """Test whoami request when unauthenticated"""
-        mock_response = Mock()
-        mock_response.is_success = False
-        mock_response.status_code = 401
-        mock_post.return_value = mock_response
+        mock_post.return_value = FakeResponse(401, reason_phrase="Unauthorized")
 
         result = await self.engine.whoami()
 
@@ -320,11 +483,9 @@ class TestLingoDotDevEngine:
     @patch("lingodotdev.engine.httpx.AsyncClient.post")
     async def test_whoami_server_error(self, mock_post):
         """Test whoami request with server error"""
-        mock_response = Mock()
-        mock_response.is_success = False
-        mock_response.status_code = 500
-        mock_response.reason_phrase = "Internal Server Error"
-        mock_post.return_value = mock_response
+        mock_post.return_value = FakeResponse(
+            500, reason_phrase="Internal Server Error"
+        )
 
         with pytest.raises(RuntimeError, match="Server error"):
             await self.engine.whoami()
@@ -332,11 +493,7 @@ class TestLingoDotDevEngine:
     @patch("lingodotdev.engine.httpx.AsyncClient.post")
     async def test_whoami_no_email(self, mock_post):
         """Test whoami request with no email in response"""
-        mock_response = Mock()
-        mock_response.is_success = True
-        mock_response.status_code = 200
-        mock_response.json.return_value = {}
-        mock_post.return_value = mock_response
+        mock_post.return_value = FakeResponse(payload={})
 
         result = await self.engine.whoami()
 
@@ -388,8 +545,103 @@ class TestLingoDotDevEngine:
             # Should have called _localize_chunk multiple times concurrently
             assert mock_chunk.call_count > 0
 
+    async def test_concurrent_processing_is_bounded(self):
+        """Test concurrent chunk requests respect max_concurrency"""
+        engine = LingoDotDevEngine(
+            {**self.config, "batch_size": 1, "max_concurrency": 2}
+        )
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_post(url, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return FakeResponse(payload={"data": json.loads(kwargs["content"])["data"]})
+
+        payload = {f"key{i}": f"value{i}" for i in range(8)}
+        with patch("lingodotdev.engine.httpx.AsyncClient.post", side_effect=fake_post):
+            result = await engine.localize_object(
+                payload, {"target_locale": "es"}, concurrent=True
+            )
+
+        assert result == payload
+        assert max_in_flight == 2
+
+    async def test_concurrent_processing_cancellation(self):
+        """Test cancelling mid-dispatch cancels already dispatched chunk requests"""
+        engine = LingoDotDevEngine({**self.config, "batch_size": 1})
+        started = 0
+
+        async def fake_post(url, **kwargs):
+            nonlocal started
+            started += 1
+            await asyncio.Event().wait()
+
+        payload = {f"key{i}": f"value{i}" for i in range(2000)}
+        with patch("lingodotdev.engine.httpx.AsyncClient.post", side_effect=fake_post):
+            task = asyncio.ensure_future(
+                engine.localize_object(
+                    payload, {"target_locale": "es"}, concurrent=True
+                )
+            )
+            for _ in range(10):
+                await asyncio.sleep(0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            await asyncio.sleep(0)
+
+        assert 0 < started < len(payload)
+        chunk_tasks = [
+            t
+            for t in asyncio.all_tasks()
+            if t.get_coro().__qualname__ == "LingoDotDevEngine._localize_chunk"
+        ]
+        assert not chunk_tasks
+
+    async def test_concurrent_processing_reuses_client(self):
+        """Test concurrent chunk requests share a single httpx client"""
+        engine = LingoDotDevEngine({**self.config, "batch_size": 1})
+
+        async def fake_post(url, **kwargs):
+            return FakeResponse(payload={"data": json.loads(kwargs["content"])["data"]})
+
+        payload = {f"key{i}": f"value{i}" for i in range(50)}
+        with patch(
+            "lingodotdev.engine.httpx.AsyncClient.post", side_effect=fake_post
+        ) as mock_post, patch(
+            "lingodotdev.engine.httpx.AsyncClient", wraps=httpx.AsyncClient
+        ) as client_cls:
+            result = await engine.localize_object(
+                payload, {"target_locale": "es"}, concurrent=True
+            )
+
+        assert result == payload
+        assert mock_post.call_count == 50
+        assert client_cls.call_count == 1
+
+    async def test_concurrent_processing_preserves_key_order(self):
+        """Test concurrent results keep payload key order when chunks finish out of order"""
+        engine = LingoDotDevEngine({**self.config, "batch_size": 1})
+
+        async def fake_post(url, **kwargs):
+            data = json.loads(kwargs["content"])["data"]
+            # Later chunks finish first
+            await asyncio.sleep(0.01 / int(next(iter(data))[3:]))
+            return FakeResponse(payload={"data": data})
+
+        payload = {f"key{i}": f"value{i}" for i in range(1, 6)}
+        with patch("lingodotdev.engine.httpx.AsyncClient.post", side_effect=fake_post):
+            result = await engine.localize_object(
+                payload, {"target_locale": "es"}, concurrent=True
+            )
+
+        assert list(result) == list(payload)
+
 
-@pytest.mark.asyncio
 class TestIntegration:
     """Integration tests with mocked HTTP responses"""
 
@@ -397,17 +649,26 @@ class TestIntegration:
         """Set up test fixtures"""
         self.config = {"api_key": "test_api_key", "api_url": "https://api.test.com"}
         self.engine = LingoDotDevEngine(self.config)
+        self.requests = []
 
-    @patch("lingodotdev.engine.httpx.AsyncClient.post")
-    async def test_full_localization_workflow(self, mock_post):
+    async def _use_transport(self, engine, payload):
+        """Route the engine's requests through a stub transport"""
+
+        def handler(request):
+            self.requests.append(request)
+            return httpx.Response(200, json=payload)
+
+        await engine._ensure_client()
+        await engine._client.aclose()
+        engine._client = httpx.AsyncClient(
+            headers=engine._base_headers, transport=httpx.MockTransport(handler)
+        )
+
+    async def test_full_localization_workflow(self):
         """Test full localization workflow"""
-        # Mock the API response
-        mock_response = Mock()
-        mock_response.is_success = True
-        mock_response.json.return_value = {
-            "data": {"greeting": "hola", "farewell": "adiós"}
-        }
-        mock_post.return_value = mock_response
+        await self._use_transport(
+            self.engine, {"data": {"greeting": "hola", "farewell": "adiós"}}
+        )
 
         # Test object localization
         result = await self.engine.localize_object(
@@ -418,12 +679,31 @@ class TestIntegration:
         assert result == {"greeting": "hola", "farewell": "adiós"}
 
         # Verify the API was called with correct parameters
-        mock_post.assert_called_once()
-        call_args = mock_post.call_args
-        assert call_args[0][0].endswith("/i18n")
+        assert len(self.requests) == 1
+        request = self.requests[0]
+        assert request.method == "POST"
+        assert str(request.url) == "https://api.test.com/i18n"
+        assert request.headers["Authorization"] == "Bearer test_api_key"
 
-        request_data = call_args[1]["json"]
+        request_data = json.loads(request.content)
         assert request_data["locale"]["source"] == "en"
         assert request_data["locale"]["target"] == "es"
         assert request_data["params"]["fast"] is True
         assert request_data["data"] == {"greeting": "hello", "farewell": "goodbye"}
+
+    async def test_reference_sent_with_every_chunk(self):
+        """Test reference translations are included in every chunk request"""
+        engine = LingoDotDevEngine({**self.config, "batch_size": 1})
+        await self._use_transport(engine, {"data": {}})
+
+        reference = {"fr": {"greeting": "bonjour"}}
+        await engine.localize_object(
+            {"greeting": "hello", "farewell": "goodbye"},
+            {"source_locale": "en", "target_locale": "es", "reference": reference},
+        )
+
+        assert len(self.requests) == 2
+        for request in self.requests:
+            request_data = json.loads(request.content)
+            assert request_data["reference"] == reference
+            assert request_data["locale"] == {"source": "en", "target": "es"}
@@ -3,12 +3,15 @@ Integration tests for the LingoDotDevEngine
 These tests can be run against a real API endpoint if provided
 """
 
+import json
 import os
 import pytest
-from unittest.mock import patch, Mock
+from unittest.mock import patch
 
 from lingodotdev import LingoDotDevEngine
 
+from .helpers import FakeResponse
+
 
 # Skip integration tests if no API key is provided
 pytestmark = pytest.mark.skipif(
@@ -17,7 +20,6 @@ pytestmark = pytest.mark.skipif(
 )
 
 
-@pytest.mark.asyncio
 class TestRealAPIIntegration:
     """Integration tests against the real API"""
 
@@ -262,7 +264,6 @@ class TestRealAPIIntegration:
                     assert result[key] != objects[i][key]  # Should be translated
 
 
-@pytest.mark.asyncio
 class TestMockedIntegration:
     """Integration tests with mocked responses for CI/CD"""
 
@@ -276,10 +277,7 @@ class TestMockedIntegration:
     async def test_large_payload_chunking(self, mock_post):
         """Test that large payloads are properly chunked"""
         # Mock API response
-        mock_response = Mock()
-        mock_response.is_success = True
-        mock_response.json.return_value = {"data": {"key": "value"}}
-        mock_post.return_value = mock_response
+        mock_post.return_value = FakeResponse(payload={"data": {"key": "value"}})
 
         # Create a large payload that will be chunked
         large_payload = {f"key_{i}": f"value_{i}" for i in range(100)}
@@ -294,10 +292,7 @@ class TestMockedIntegration:
     @patch("lingodotdev.engine.httpx.AsyncClient.post")
     async def test_reference_parameter(self, mock_post):
         """Test that reference parameter is properly handled"""
-        mock_response = Mock()
-        mock_response.is_success = True
-        mock_response.json.return_value = {"data": {"key": "value"}}
-        mock_post.return_value = mock_response
+        mock_post.return_value = FakeResponse(payload={"data": {"key": "value"}})
 
         reference = {
             "es": {"key": "valor de referencia"},
@@ -311,18 +306,14 @@ class TestMockedIntegration:
 
         # Check that reference was included in the request
         mock_post.assert_called_once()
-        call_args = mock_post.call_args
-        request_data = call_args[1]["json"]
+        request_data = json.loads(mock_post.call_args.kwargs["content"])
         assert "reference" in request_data
         assert request_data["reference"] == reference
 
     @patch("lingodotdev.engine.httpx.AsyncClient.post")
     async def test_workflow_id_consistency(self, mock_post):
         """Test that workflow ID is consistent across chunks"""
-        mock_response = Mock()
-        mock_response.is_success = True
-        mock_response.json.return_value = {"data": {"key": "value"}}
-        mock_post.return_value = mock_response
+        mock_post.return_value = FakeResponse(payload={"data": {"key": "value"}})
 
         # Create a payload that will be chunked
         large_payload = {f"key_{i}": f"value_{i}" for i in range(50)}
@@ -334,7 +325,7 @@ class TestMockedIntegration:
         # Extract workflow IDs from all calls
         workflow_ids = []
         for call in mock_post.call_args_list:
-            request_data = call[1]["json"]
+            request_data = json.loads(call.kwargs["content"])
             workflow_id = request_data["params"]["workflowId"]
             workflow_ids.append(workflow_id)
 
@@ -350,10 +341,7 @@ class TestMockedIntegration:
         # Mock API response with delay to test concurrency
         async def mock_response_with_delay(*args, **kwargs):
             await asyncio.sleep(0.1)  # Small delay
-            mock_resp = type("MockResponse", (), {})()
-            mock_resp.is_success = True
-            mock_resp.json = lambda: {"data": {"key": "value"}}
-            return mock_resp
+            return FakeResponse(payload={"data": {"key": "value"}})
 
         mock_post.side_effect = mock_response_with_delay
 